@@ -490,7 +490,7 @@ class Inference(BaseInference):
                 step=frames.step,
             )
 
-        masks = 1 - np.isnan(scores)
+        masks = 1 - np.isnan(scores.data)
         scores.data = np.nan_to_num(scores.data, copy=True, nan=0.0)
 
         # Hamming window used for overlap-add aggregation
@@ -542,32 +542,41 @@ class Inference(BaseInference):
             (num_frames, num_classes), dtype=np.float32
         )
 
-        # loop on the scores of sliding chunks
-        for (chunk, score), (_, mask) in zip(scores, masks):
-            # chunk ~ Segment
-            # score ~ (num_frames_per_chunk, num_classes)-shaped np.ndarray
-            # mask ~ (num_frames_per_chunk, num_classes)-shaped np.ndarray
-
-            start_frame = frames.closest_frame(chunk.start)
-            aggregated_output[start_frame : start_frame + num_frames_per_chunk] += (
-                score * mask * hamming_window * warm_up_window
-            )
-
-            overlapping_chunk_count[
-                start_frame : start_frame + num_frames_per_chunk
-            ] += (mask * hamming_window * warm_up_window)
-
-            aggregated_mask[
-                start_frame : start_frame + num_frames_per_chunk
-            ] = np.maximum(
-                aggregated_mask[start_frame : start_frame + num_frames_per_chunk],
-                mask,
-            )
+        # frame indices covered by each chunk
+        start_frames = np.array(
+            [
+                frames.closest_frame(chunks.start + c * chunks.step)
+                for c in range(num_chunks)
+            ],
+            dtype=int,
+        )
+        frame_indices = (
+            start_frames[:, np.newaxis] + np.arange(num_frames_per_chunk)
+        ).reshape(-1)
+
+        # accumulate the scores of all sliding chunks at once
+        weighted_masks = masks * hamming_window * warm_up_window
+        np.add.at(
+            aggregated_output,
+            frame_indices,
+            (scores.data * weighted_masks).reshape(-1, num_classes),
+        )
+        np.add.at(
+            overlapping_chunk_count,
+            frame_indices,
+            weighted_masks.reshape(-1, num_classes),
+        )
+        np.maximum.at(aggregated_mask, frame_indices, masks.reshape(-1, num_classes))
 
         if skip_average:
             average = aggregated_output
         else:
-            average = aggregated_output / np.maximum(overlapping_chunk_count, epsilon)
+            average = np.divide(
+                aggregated_output,
+                overlapping_chunk_count,
+                out=np.zeros_like(aggregated_output),
+                where=overlapping_chunk_count > 0.0,
+            )
 
         average[aggregated_mask == 0.0] = missing
 
@@ -683,11 +692,19 @@ class Inference(BaseInference):
 
             match_func = always_match
 
+        # raw (num_chunks, num_frames, num_classes) scores, sliced directly
+        # to avoid going through SlidingWindowFeature.__getitem__ for every
+        # (chunk, chunk) pair and every matched speaker
+        data = activations.data
+
         stitches = []
-        for C, (chunk, activation) in enumerate(activations):
+        for C in range(num_chunks):
+
+            chunk = chunks[C]
+            activation = data[C]
 
-            local_stitch = np.NAN * np.zeros(
-                (sum(lookahead) + 1, num_frames, num_classes)
+            local_stitch = np.full(
+                (sum(lookahead) + 1, num_frames, num_classes), np.NAN, dtype=np.float32
             )
 
             for c in range(
@@ -700,10 +717,10 @@ class Inference(BaseInference):
                 if shift < 0:
                     shift = -shift
                     this_activations = activation[shift:]
-                    that_activations = activations[c, : num_frames - shift]
+                    that_activations = data[c, : num_frames - shift]
                 else:
                     this_activations = activation[: num_frames - shift]
-                    that_activations = activations[c, shift:]
+                    that_activations = data[c, shift:]
 
                 # find the optimal one-to-one mapping
                 _, (permutation,), (cost,) = permutate(
@@ -725,9 +742,7 @@ class Inference(BaseInference):
                     )
 
                     if matching:
-                        local_stitch[c - C + lookahead[0], :, this] = activations[
-                            c, :, that
-                        ]
+                        local_stitch[c - C + lookahead[0], :, this] = data[c, :, that]
 
                     # TODO: do not lookahead further once a mismatch is found
 
@@ -30,6 +30,8 @@ import networkx as nx
 import numpy as np
 from pyannote.core import SlidingWindowFeature
 from pyannote.pipeline.parameter import Uniform
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
 from pyannote.audio.core.inference import Inference
 from pyannote.audio.core.io import AudioFile
@@ -158,61 +160,93 @@ class SpeakerSegmentation(SpeakerDiarizationMixin, Pipeline):
         Returns
         -------
         stitching_graph : nx.Graph
-            Nodes are (chunk_idx, speaker_idx) tuples.
+            Nodes are (chunk_idx * num_speakers + speaker_idx) integer ids,
+            with num_speakers stored as a "num_speakers" graph attribute.
             An edge between two nodes indicate that those are likely to be the same speaker
             (the lower the value of "cost" attribute, the more likely).
         """
 
         chunks = segmentations.sliding_window
-        num_chunks, num_frames, _ = segmentations.data.shape
+        num_chunks, num_frames, num_speakers = segmentations.data.shape
         max_lookahead = math.floor(chunks.duration / chunks.step - 1)
         lookahead = 2 * (max_lookahead,)
 
-        stitching_graph = nx.Graph()
+        # nodes are integer ids: scalar ints are cheaper to hash and store
+        # than (chunk_idx, speaker_idx) tuples.  nodes and edges are
+        # accumulated in plain lists and inserted in bulk at the end
+        stitching_graph = nx.Graph(num_speakers=num_speakers)
+        graph_nodes = []
+        graph_edges = []
+
+        # raw (num_chunks, num_frames, local_num_speakers) scores, sliced
+        # directly to avoid going through SlidingWindowFeature.__getitem__
+        # for every (chunk, chunk) pair
+        data = segmentations.data
+
+        # threshold the whole score tensor once: per-offset activity flags
+        # then reduce boolean views of this precomputed mask
+        active = data > onset
+
+        # all pairs of chunks at a given relative offset share the same
+        # common temporal support: gather them in a single batch and find
+        # their optimal one-to-one mappings with one call to `permutate`.
+        # each unordered pair is processed once only: mean absolute error
+        # is symmetric, so the reversed direction would produce the exact
+        # same mapping, costs and activity flags
+        for offset in range(1, lookahead[1] + 1):
+
+            num_pairs = num_chunks - offset
+            if num_pairs < 1:
+                break
+
+            # extract common temporal support
+            shift = round(offset * num_frames * chunks.step / chunks.duration)
+
+            this_batch = data[:num_pairs, shift:]
+            that_batch = data[offset:, : num_frames - shift]
+
+            # find the optimal one-to-one mappings
+            _, permutations, costs = permutate(
+                this_batch,
+                that_batch,
+                cost_func=mae_cost_func,
+                return_cost=True,
+            )
 
-        for C, (chunk, segmentation) in enumerate(segmentations):
-            for c in range(
-                max(0, C - lookahead[0]), min(num_chunks, C + lookahead[1] + 1)
-            ):
+            # find which speakers are active on the common temporal support,
+            # for the whole batch at once
+            this_active = np.any(active[:num_pairs, shift:], axis=1)
+            that_active = np.any(active[offset:, : num_frames - shift], axis=1)
 
-                if c == C:
-                    continue
+            for C, (permutation, cost) in enumerate(zip(permutations, costs)):
 
-                # extract common temporal support
-                shift = round((C - c) * num_frames * chunks.step / chunks.duration)
-
-                if shift < 0:
-                    shift = -shift
-                    this_segmentations = segmentation[shift:]
-                    that_segmentations = segmentations[c, : num_frames - shift]
-                else:
-                    this_segmentations = segmentation[: num_frames - shift]
-                    that_segmentations = segmentations[c, shift:]
-
-                # find the optimal one-to-one mapping
-                _, (permutation,), (cost,) = permutate(
-                    this_segmentations[np.newaxis],
-                    that_segmentations,
-                    cost_func=mae_cost_func,
-                    return_cost=True,
-                )
+                c = C + offset
+                this_base = C * num_speakers
+                that_base = c * num_speakers
 
                 for this, that in enumerate(permutation):
 
-                    this_is_active = np.any(this_segmentations[:, this] > onset)
-                    that_is_active = np.any(that_segmentations[:, that] > onset)
+                    this_is_active = this_active[C, this]
+                    that_is_active = that_active[C, that]
 
                     if this_is_active:
-                        stitching_graph.add_node((C, this))
+                        graph_nodes.append(this_base + this)
 
                     if that_is_active:
-                        stitching_graph.add_node((c, that))
+                        graph_nodes.append(that_base + that)
 
                     if this_is_active and that_is_active:
-                        stitching_graph.add_edge(
-                            (C, this), (c, that), cost=cost[this, that]
+                        graph_edges.append(
+                            (
+                                this_base + this,
+                                that_base + that,
+                                {"cost": cost[this, that]},
+                            )
                         )
 
+        stitching_graph.add_nodes_from(graph_nodes)
+        stitching_graph.add_edges_from(graph_edges)
+
         return stitching_graph
 
     @staticmethod
@@ -235,19 +269,73 @@ class SpeakerSegmentation(SpeakerDiarizationMixin, Pipeline):
 
         """
 
-        f = stitching_graph.copy()
-        while f:
-            f.remove_edges_from(
-                [
-                    (n1, n2)
-                    for n1, n2, cost in f.edges(data="cost")
-                    if cost > stitch_threshold
-                ]
+        # nodes are (chunk_idx * num_speakers + speaker_idx) integer ids:
+        # connected components are obtained from a sparse adjacency matrix
+        # rather than from a (much slower) networkx working copy
+        num_speakers = stitching_graph.graph["num_speakers"]
+        nodes = np.sort(np.fromiter(stitching_graph.nodes, dtype=np.int64))
+        num_nodes = len(nodes)
+        node_chunks = nodes // num_speakers
+
+        # sort edges by decreasing cost once: since the threshold only ever
+        # decreases, edges above the current threshold always form a prefix
+        # of these arrays
+        edges = sorted(
+            stitching_graph.edges(data="cost"),
+            key=lambda edge: edge[2],
+            reverse=True,
+        )
+        num_edges = len(edges)
+        sources = np.searchsorted(
+            nodes,
+            np.fromiter((n1 for n1, _, _ in edges), dtype=np.int64, count=num_edges),
+        )
+        targets = np.searchsorted(
+            nodes,
+            np.fromiter((n2 for _, n2, _ in edges), dtype=np.int64, count=num_edges),
+        )
+        costs = -np.fromiter(
+            (cost for _, _, cost in edges), dtype=float, count=num_edges
+        )
+
+        alive = np.ones(num_nodes, dtype=bool)
+
+        while np.any(alive):
+
+            # skip edges above the current threshold, as well as edges with
+            # an endpoint in an already-yielded component
+            first_kept = np.searchsorted(costs, -stitch_threshold)
+            keep = alive[sources[first_kept:]] & alive[targets[first_kept:]]
+            row = sources[first_kept:][keep]
+            col = targets[first_kept:][keep]
+
+            adjacency = coo_matrix(
+                (np.ones(len(row)), (row, col)), shape=(num_nodes, num_nodes)
             )
-            for component in list(nx.connected_components(f)):
-                if len(set(c for c, _ in component)) == len(component):
-                    yield component
-                    f.remove_nodes_from(component)
+            _, labels = connected_components(adjacency, directed=False)
+
+            # group remaining nodes by component
+            alive_nodes = np.flatnonzero(alive)
+            alive_labels = labels[alive_nodes]
+            order = np.argsort(alive_labels, kind="stable")
+            alive_nodes = alive_nodes[order]
+            alive_labels = alive_labels[order]
+            boundaries = np.flatnonzero(np.diff(alive_labels)) + 1
+
+            # a component is stitchable iff it holds at most one node per
+            # chunk.  nodes of a component come out sorted by id (hence by
+            # chunk), so repeated chunks appear as consecutive entries: spot
+            # them all in one pass rather than one np.unique per component
+            alive_chunks = node_chunks[alive_nodes]
+            duplicated = (np.diff(alive_labels) == 0) & (np.diff(alive_chunks) == 0)
+            unstitchable = set(alive_labels[:-1][duplicated].tolist())
+
+            for component in np.split(alive_nodes, boundaries):
+                if labels[component[0]] in unstitchable:
+                    continue
+                yield {divmod(node, num_speakers) for node in nodes[component].tolist()}
+                alive[component] = False
+
             stitch_threshold *= factor
 
     def apply(
@@ -293,28 +381,31 @@ class SpeakerSegmentation(SpeakerDiarizationMixin, Pipeline):
 
         hook("segmentation", segmentations)
 
+        # hyper-parameters are resolved through pyannote.pipeline descriptors:
+        # look them up once per call
+        onset, offset = self.onset, self.offset
+        warm_up = (self.warm_up, self.warm_up)
+
         if self.skip_stitching:
             return binarize(
-                segmentations, onset=self.onset, offset=self.offset, initial_state=False
+                segmentations, onset=onset, offset=offset, initial_state=False
             )
 
         # estimate frame-level number of instantaneous speakers
         count = self.speaker_count(
             segmentations,
-            onset=self.onset,
-            offset=self.offset,
-            warm_up=(self.warm_up, self.warm_up),
+            onset=onset,
+            offset=offset,
+            warm_up=warm_up,
             frames=self._frames,
         )
         hook("speaker_counting", count)
 
         # trim warm-up regions
-        segmentations = Inference.trim(
-            segmentations, warm_up=(self.warm_up, self.warm_up)
-        )
+        segmentations = Inference.trim(segmentations, warm_up=warm_up)
 
         # build stitching graph
-        stitching_graph = self.get_stitching_graph(segmentations, onset=self.onset)
+        stitching_graph = self.get_stitching_graph(segmentations, onset=onset)
 
         # find (constraint-compliant) connected components
         components = list(
@@ -326,13 +417,26 @@ class SpeakerSegmentation(SpeakerDiarizationMixin, Pipeline):
         num_stitches = len(components)
         num_chunks, num_frames, _ = segmentations.data.shape
 
-        stitched_segmentations = np.NAN * np.zeros(
-            (num_chunks, num_frames, num_stitches)
+        # float32 is plenty for model scores and halves memory traffic
+        stitched_segmentations = np.full(
+            (num_chunks, num_frames, num_stitches), np.NAN, dtype=np.float32
         )
 
-        for k, component in enumerate(components):
-            for c, s in component:
-                stitched_segmentations[c, :, k] = segmentations.data[c, :, s]
+        # flatten components into precomputed (chunk, speaker, stitch) index
+        # arrays and fill all stitched activations with one fancy-indexed copy
+        if num_stitches > 0:
+            members = np.array(
+                [node for component in components for node in component],
+                dtype=np.int32,
+            )
+            stitch_indices = np.repeat(
+                np.arange(num_stitches),
+                [len(component) for component in components],
+            )
+            chunk_indices, speaker_indices = members[:, 0], members[:, 1]
+            stitched_segmentations[
+                chunk_indices, :, stitch_indices
+            ] = segmentations.data[chunk_indices, :, speaker_indices]
 
         stitched_segmentations = SlidingWindowFeature(
             stitched_segmentations, segmentations.sliding_window
@@ -345,7 +449,7 @@ class SpeakerSegmentation(SpeakerDiarizationMixin, Pipeline):
 
         # remove inactive speakers
         discrete_diarization.data = discrete_diarization.data[
-            :, np.nonzero(np.sum(discrete_diarization.data, axis=0))[0]
+            :, np.any(discrete_diarization.data, axis=0)
         ]
 
         if self.skip_conversion:
@@ -227,9 +227,16 @@ class SpeakerDiarizationMixin:
         sorted_speakers = np.argsort(-activations, axis=-1)
         binary = np.zeros_like(activations.data)
 
-        for t, ((_, c), speakers) in enumerate(zip(count, sorted_speakers)):
-            for i in range(c.item()):
-                binary[t, speakers[i]] = 1.0
+        # mark the `count` most active speakers of each frame in one pass:
+        # rank r speaker is retained whenever r < count
+        num_frames = min(len(binary), len(count.data))
+        speaker_rank = np.arange(binary.shape[1])
+        np.put_along_axis(
+            binary[:num_frames],
+            sorted_speakers[:num_frames],
+            speaker_rank < count.data[:num_frames],
+            axis=1,
+        )
 
         return SlidingWindowFeature(binary, activations.sliding_window)
 
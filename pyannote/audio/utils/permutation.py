@@ -22,8 +22,9 @@
 
 
 import math
+from itertools import permutations
 from typing import Callable, List, Optional, Tuple
-from functools import singledispatch, partial
+from functools import lru_cache, singledispatch, partial
 
 import networkx as nx
 import numpy as np
@@ -95,6 +96,12 @@ def mae_cost_func(Y, y, **kwargs):
     return torch.mean(torch.abs(Y - y), axis=0)
 
 
+@lru_cache(maxsize=None)
+def _all_permutations(num_classes: int) -> np.ndarray:
+    """Enumerate all permutations of {0, ..., num_classes - 1}"""
+    return np.array(list(permutations(range(num_classes))))
+
+
 @permutate.register
 def permutate_torch(
     y1: torch.Tensor,
@@ -132,12 +139,12 @@ def permutate_torch(
         # y1_ is (num_samples, num_classes_1)-shaped
         # y2_ is (num_samples, num_classes_2)-shaped
         with torch.no_grad():
-            cost = torch.stack(
-                [
-                    cost_func(y2_, y1_[:, i : i + 1].expand(-1, num_classes_2))
-                    for i in range(num_classes_1)
-                ],
-            )
+            # compute the whole (num_classes_1, num_classes_2) cost matrix
+            # in one call by laying out every (y1, y2) class pair side by side
+            cost = cost_func(
+                y2_.repeat(1, num_classes_1),
+                y1_.repeat_interleave(num_classes_2, dim=1),
+            ).view(num_classes_1, num_classes_2)
 
         if num_classes_2 > num_classes_1:
             padded_cost = F.pad(
@@ -149,8 +156,21 @@ def permutate_torch(
         else:
             padded_cost = cost
 
+        # for the handful of speakers output by segmentation models, a
+        # vectorized brute force over all permutations of the (square) cost
+        # matrix is faster than the Hungarian algorithm
+        if num_classes_1 <= num_classes_2 <= 6:
+            cost_matrix = padded_cost.cpu().numpy()
+            candidates = _all_permutations(num_classes_2)
+            best = candidates[
+                np.argmin(cost_matrix[np.arange(num_classes_2), candidates].sum(axis=1))
+            ]
+            assignment = enumerate(best.tolist())
+        else:
+            assignment = zip(*linear_sum_assignment(padded_cost.cpu()))
+
         permutation = [None] * num_classes_1
-        for k1, k2 in zip(*linear_sum_assignment(padded_cost.cpu())):
+        for k1, k2 in assignment:
             if k1 < num_classes_1:
                 permutation[k1] = k2
                 permutated_y2[b, :, k1] = y2_[:, k2]